@@ -70,7 +70,9 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache(maxsize=1)
+# maxsize=None selects lru_cache's simpler unbounded fast path, which skips
+# the bookkeeping a bounded cache does on every hit.
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
     """Return a cached Settings instance."""
 
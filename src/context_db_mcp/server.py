@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+import weakref
+from typing import Final, List, Optional
 
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.server import Context
@@ -14,6 +15,7 @@ from .vector_store import (
     GetVectorStoreInfoResponse,
     IngestDocumentRequest,
     IngestDocumentResponse,
+    IngestDocumentsResponse,
     OpenAIContextStore,
     RetrieveRelevantChunksRequest,
     RetrieveRelevantChunksResponse,
@@ -22,6 +24,81 @@ from .vector_store import (
 
 LOGGER_NAME = "context_db_mcp"
 
+# Tool descriptions are hoisted to module level so repeated build_server()
+# calls reference the same interned constants instead of re-materializing
+# the multi-kilobyte strings.
+_INGEST_DESCRIPTION: Final[str] = (
+    "Add a plain-text document or feature summary into the configured OpenAI vector store "
+    "so that future tasks can retrieve it.\n\n"
+    "Required Parameters:\n"
+    "- content (string): The plain-text content to ingest. Must not be empty.\n\n"
+    "Optional Parameters:\n"
+    "- vector_store_id (string): Target vector store ID. If omitted, uses default from config.\n"
+    "- vector_store_name (string): Vector store name to create/find. Used only if vector_store_id is not provided.\n"
+    "- document_id (string): Stable identifier for the document (stored as file attribute).\n"
+    "- filename (string): Logical filename for the uploaded document. Auto-generated if omitted.\n"
+    "- summary (string): High-level summary or title (stored as attribute).\n"
+    "- attributes (object): Additional key/value pairs to attach as file attributes.\n"
+    "- chunking_strategy (object): OpenAI chunking strategy configuration.\n"
+    "- mime_type (string): MIME type of the file. Defaults to 'text/plain'.\n\n"
+    "Example:\n"
+    "{\n"
+    "  \"content\": \"This is my document content\",\n"
+    "  \"document_id\": \"doc-2025-11-06\",\n"
+    "  \"summary\": \"Summary of feature implementation\",\n"
+    "  \"filename\": \"feature-summary.txt\"\n"
+    "}"
+)
+
+_INGEST_MANY_DESCRIPTION: Final[str] = (
+    "Ingest several plain-text documents into OpenAI vector stores in one call.\n\n"
+    "Required Parameters:\n"
+    "- requests (array): A list of request objects with the same shape as the ingest_document tool input.\n\n"
+    "Uploads are dispatched concurrently and processing status is polled in batches, so this is "
+    "substantially faster than calling ingest_document once per document.\n\n"
+    "Response Format:\n"
+    "Returns one ingest_document result per request, in the same order."
+)
+
+_RETRIEVE_DESCRIPTION: Final[str] = (
+    "Search the configured OpenAI vector store for the chunks most relevant to the provided query.\n\n"
+    "Required Parameters:\n"
+    "- query (string): The search query that drives similarity search. Must not be empty.\n\n"
+    "Optional Parameters:\n"
+    "- vector_store_id (string): Vector store to query. If omitted, uses default from config.\n"
+    "- max_results (integer): Maximum number of chunks to return. Range: 1-50. Uses default from config if omitted.\n"
+    "- score_threshold (float): Minimum similarity score (0.0-1.0) required for chunk inclusion. Lower scores = less similar.\n"
+    "- attributes_filter (object): Exact-match filters on file attributes (e.g., {\"document_id\": \"doc-123\"}).\n"
+    "- rewrite_query (boolean): Enable/disable OpenAI's automatic query rewriting for better results.\n\n"
+    "Response Format:\n"
+    "Returns a list of chunks, each containing:\n"
+    "- file_id: The vector store file ID\n"
+    "- filename: Name of the source file\n"
+    "- score: Similarity score (0.0-1.0, higher = more relevant)\n"
+    "- text: The actual chunk content\n"
+    "- attributes: File metadata (document_id, summary, ingested_at, etc.)\n\n"
+    "Example:\n"
+    "{\n"
+    "  \"query\": \"How does user authentication work?\",\n"
+    "  \"max_results\": 5,\n"
+    "  \"score_threshold\": 0.7\n"
+    "}"
+)
+
+_INFO_DESCRIPTION: Final[str] = (
+    "Get information about the configured OpenAI vector store.\n\n"
+    "Optional Parameters:\n"
+    "- vector_store_id (string): Vector store ID to query. If omitted, uses default from config.\n\n"
+    "Response Format:\n"
+    "Returns information about the vector store:\n"
+    "- vector_store_id: The ID of the vector store\n"
+    "- vector_store_name: The name of the vector store (if available)\n\n"
+    "Example:\n"
+    "{\n"
+    "  \"vector_store_id\": \"vs_abc123\"\n"
+    "}"
+)
+
 
 def configure_logging(log_level: str) -> None:
     """Configure root logging based on user preference."""
@@ -33,6 +110,32 @@ def configure_logging(log_level: str) -> None:
     )
 
 
+# Store instances are memoized per Settings object so repeated
+# build_server() calls (tests, stdio respawns within a process) reuse one
+# OpenAI client and its httpx connection pool instead of re-initializing the
+# TLS stack each time. Settings is not hashable, so the cache is keyed by
+# id(); the store is held weakly (each store strongly references its
+# settings, so a settings-keyed weakref could never fire) and an entry
+# lives exactly as long as some server still uses its store — dropped
+# servers do not leak clients, and the identity check guards against a
+# recycled id aliasing a different Settings object.
+_STORE_CACHE: "weakref.WeakValueDictionary[int, OpenAIContextStore]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _get_store(settings: Settings) -> OpenAIContextStore:
+    """Return the memoized context store for a Settings instance."""
+
+    key = id(settings)
+    store = _STORE_CACHE.get(key)
+    if store is not None and store._settings is settings:
+        return store
+    store = OpenAIContextStore(settings)
+    _STORE_CACHE[key] = store
+    return store
+
+
 def build_server(settings: Optional[Settings] = None) -> FastMCP:
     """Instantiate the MCP server and register tooling."""
 
@@ -42,7 +145,7 @@ def build_server(settings: Optional[Settings] = None) -> FastMCP:
     configure_logging(settings.log_level)
     logger = logging.getLogger(LOGGER_NAME)
 
-    store = OpenAIContextStore(settings)
+    store = _get_store(settings)
 
     server = FastMCP(
         "context-db-mcp",
@@ -55,28 +158,7 @@ def build_server(settings: Optional[Settings] = None) -> FastMCP:
     @server.tool(
         name="ingest_document",
         title="Ingest Document",
-        description=(
-            "Add a plain-text document or feature summary into the configured OpenAI vector store "
-            "so that future tasks can retrieve it.\n\n"
-            "Required Parameters:\n"
-            "- content (string): The plain-text content to ingest. Must not be empty.\n\n"
-            "Optional Parameters:\n"
-            "- vector_store_id (string): Target vector store ID. If omitted, uses default from config.\n"
-            "- vector_store_name (string): Vector store name to create/find. Used only if vector_store_id is not provided.\n"
-            "- document_id (string): Stable identifier for the document (stored as file attribute).\n"
-            "- filename (string): Logical filename for the uploaded document. Auto-generated if omitted.\n"
-            "- summary (string): High-level summary or title (stored as attribute).\n"
-            "- attributes (object): Additional key/value pairs to attach as file attributes.\n"
-            "- chunking_strategy (object): OpenAI chunking strategy configuration.\n"
-            "- mime_type (string): MIME type of the file. Defaults to 'text/plain'.\n\n"
-            "Example:\n"
-            "{\n"
-            "  \"content\": \"This is my document content\",\n"
-            "  \"document_id\": \"doc-2025-11-06\",\n"
-            "  \"summary\": \"Summary of feature implementation\",\n"
-            "  \"filename\": \"feature-summary.txt\"\n"
-            "}"
-        ),
+        description=_INGEST_DESCRIPTION,
         structured_output=True,
     )
     def ingest_document(request: IngestDocumentRequest, ctx: Context) -> IngestDocumentResponse:
@@ -90,33 +172,26 @@ def build_server(settings: Optional[Settings] = None) -> FastMCP:
         logger.debug("Attributes applied to file %s: %s", result.file_id, result.attributes)
         return result
 
+    @server.tool(
+        name="ingest_documents",
+        title="Ingest Documents",
+        description=_INGEST_MANY_DESCRIPTION,
+        structured_output=True,
+    )
+    def ingest_documents(
+        requests: List[IngestDocumentRequest], ctx: Context
+    ) -> IngestDocumentsResponse:
+        """Tool for ingesting a batch of documents into the vector store."""
+
+        ctx.info(f"Ingesting {len(requests)} documents into vector store...")
+        results = store.ingest_many(requests)
+        ctx.info(f"Stored {len(results)} files")
+        return IngestDocumentsResponse.model_construct(results=results)
+
     @server.tool(
         name="retrieve_relevant_chunks",
         title="Retrieve Relevant Chunks",
-        description=(
-            "Search the configured OpenAI vector store for the chunks most relevant to the provided query.\n\n"
-            "Required Parameters:\n"
-            "- query (string): The search query that drives similarity search. Must not be empty.\n\n"
-            "Optional Parameters:\n"
-            "- vector_store_id (string): Vector store to query. If omitted, uses default from config.\n"
-            "- max_results (integer): Maximum number of chunks to return. Range: 1-50. Uses default from config if omitted.\n"
-            "- score_threshold (float): Minimum similarity score (0.0-1.0) required for chunk inclusion. Lower scores = less similar.\n"
-            "- attributes_filter (object): Exact-match filters on file attributes (e.g., {\"document_id\": \"doc-123\"}).\n"
-            "- rewrite_query (boolean): Enable/disable OpenAI's automatic query rewriting for better results.\n\n"
-            "Response Format:\n"
-            "Returns a list of chunks, each containing:\n"
-            "- file_id: The vector store file ID\n"
-            "- filename: Name of the source file\n"
-            "- score: Similarity score (0.0-1.0, higher = more relevant)\n"
-            "- text: The actual chunk content\n"
-            "- attributes: File metadata (document_id, summary, ingested_at, etc.)\n\n"
-            "Example:\n"
-            "{\n"
-            "  \"query\": \"How does user authentication work?\",\n"
-            "  \"max_results\": 5,\n"
-            "  \"score_threshold\": 0.7\n"
-            "}"
-        ),
+        description=_RETRIEVE_DESCRIPTION,
         structured_output=True,
     )
     def retrieve_relevant_chunks(
@@ -134,19 +209,7 @@ def build_server(settings: Optional[Settings] = None) -> FastMCP:
     @server.tool(
         name="get_vector_store_info",
         title="Get Vector Store Info",
-        description=(
-            "Get information about the configured OpenAI vector store.\n\n"
-            "Optional Parameters:\n"
-            "- vector_store_id (string): Vector store ID to query. If omitted, uses default from config.\n\n"
-            "Response Format:\n"
-            "Returns information about the vector store:\n"
-            "- vector_store_id: The ID of the vector store\n"
-            "- vector_store_name: The name of the vector store (if available)\n\n"
-            "Example:\n"
-            "{\n"
-            "  \"vector_store_id\": \"vs_abc123\"\n"
-            "}"
-        ),
+        description=_INFO_DESCRIPTION,
         structured_output=True,
     )
     def get_vector_store_info(
@@ -2,26 +2,104 @@
 
 from __future__ import annotations
 
+import codecs
 import io
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
-from openai import OpenAI
-from openai._types import FileTypes
-from openai.types import VectorStore
 from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic.json_schema import (
+    DEFAULT_REF_TEMPLATE,
+    GenerateJsonSchema,
+    JsonSchemaMode,
+)
 
 from .config import Settings
 
+if TYPE_CHECKING:
+    from openai._types import FileTypes
+    from openai.types import VectorStore
+
 
 logger = logging.getLogger(__name__)
 
 
 AttributesType = Dict[str, Union[str, float, bool]]
 
+#: How long a cached name -> vector store index stays valid before the next
+#: lookup re-pages through the API.
+_NAME_INDEX_TTL_SECONDS = 60.0
+
+#: Documents at or above this size (in characters) are encoded into the
+#: upload buffer incrementally so the str and its full UTF-8 encoding never
+#: coexist in memory.
+_STREAMING_ENCODE_THRESHOLD = 1 << 20
+
+#: Slice size used when incrementally encoding large documents.
+_ENCODE_CHUNK_CHARS = 64 * 1024
+
+#: Translation table used to slugify summaries in a single C-level pass.
+_SLUG_TABLE = str.maketrans({" ": "-"})
+
+#: Upper bound on concurrent uploads issued by a batched ingest.
+_MAX_UPLOAD_WORKERS = 8
+
+
+class _SchemaCachedModel(BaseModel):
+    """Base model that memoizes generated JSON schemas per argument signature.
+
+    FastMCP serializes the response models into JSON schemas during tool
+    registration and passes explicit arguments (``by_alias=True`` for
+    parameters, ``schema_generator=StrictJsonSchema`` for output models), so
+    the cache is keyed on the full argument tuple. Repeated ``build_server``
+    calls (e.g. stdio respawns) then reuse the generated schema instead of
+    re-running schema generation.
+    """
+
+    __schema_cache__: ClassVar[Dict[Any, Dict[str, Any]]] = {}
+
+    @classmethod
+    def model_json_schema(
+        cls,
+        by_alias: bool = True,
+        ref_template: str = DEFAULT_REF_TEMPLATE,
+        schema_generator: Type[GenerateJsonSchema] = GenerateJsonSchema,
+        mode: JsonSchemaMode = "validation",
+    ) -> Dict[str, Any]:
+        cache = cls.__dict__.get("__schema_cache__")
+        if cache is None:
+            cache = {}
+            cls.__schema_cache__ = cache
+        key = (by_alias, ref_template, schema_generator, mode)
+        schema = cache.get(key)
+        if schema is None:
+            schema = super().model_json_schema(
+                by_alias=by_alias,
+                ref_template=ref_template,
+                schema_generator=schema_generator,
+                mode=mode,
+            )
+            cache[key] = schema
+        return schema
+
 
-class IngestDocumentRequest(BaseModel):
+class IngestDocumentRequest(_SchemaCachedModel):
     """Schema for ingesting a document into a vector store."""
 
     model_config = ConfigDict(extra="forbid")
@@ -62,12 +140,13 @@ class IngestDocumentRequest(BaseModel):
 
     @model_validator(mode="after")
     def ensure_store_reference(self) -> "IngestDocumentRequest":
-        if not self.content.strip():
+        # Allocation-free emptiness check; isspace() is False for "".
+        if not self.content or self.content.isspace():
             raise ValueError("The document content is empty after stripping whitespace.")
         return self
 
 
-class IngestDocumentResponse(BaseModel):
+class IngestDocumentResponse(_SchemaCachedModel):
     """Structured result returned after ingesting a document."""
 
     model_config = ConfigDict(extra="forbid")
@@ -80,7 +159,15 @@ class IngestDocumentResponse(BaseModel):
     attributes: Optional[AttributesType]
 
 
-class RetrieveRelevantChunksRequest(BaseModel):
+class IngestDocumentsResponse(_SchemaCachedModel):
+    """Structured results for a batched ingest call."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    results: List[IngestDocumentResponse]
+
+
+class RetrieveRelevantChunksRequest(_SchemaCachedModel):
     """Schema for retrieving context from a vector store."""
 
     model_config = ConfigDict(extra="forbid")
@@ -111,15 +198,21 @@ class RetrieveRelevantChunksRequest(BaseModel):
 
     @model_validator(mode="after")
     def ensure_query(self) -> "RetrieveRelevantChunksRequest":
-        if not self.query.strip():
+        if not self.query or self.query.isspace():
             raise ValueError("The search query is empty after stripping whitespace.")
         return self
 
 
-class RetrievedChunk(BaseModel):
-    """Chunk result emitted by a retrieval call."""
+@dataclass(slots=True, frozen=True)
+class RetrievedChunk:
+    """Chunk result emitted by a retrieval call.
 
-    model_config = ConfigDict(extra="forbid")
+    A slotted dataclass rather than a pydantic model: instances are created
+    per result in the retrieve hot loop (up to 50 per query), and the slots
+    layout is several times smaller and cheaper to construct than a
+    ``BaseModel``. Pydantic still validates and serializes it transparently
+    as a field of :class:`RetrieveRelevantChunksResponse`.
+    """
 
     file_id: str
     filename: str
@@ -128,7 +221,7 @@ class RetrievedChunk(BaseModel):
     attributes: Optional[AttributesType]
 
 
-class RetrieveRelevantChunksResponse(BaseModel):
+class RetrieveRelevantChunksResponse(_SchemaCachedModel):
     """Structured response body for chunk retrieval."""
 
     model_config = ConfigDict(extra="forbid")
@@ -138,7 +231,7 @@ class RetrieveRelevantChunksResponse(BaseModel):
     results: List[RetrievedChunk]
 
 
-class GetVectorStoreInfoResponse(BaseModel):
+class GetVectorStoreInfoResponse(_SchemaCachedModel):
     """Response containing vector store information."""
 
     model_config = ConfigDict(extra="forbid")
@@ -147,6 +240,34 @@ class GetVectorStoreInfoResponse(BaseModel):
     vector_store_name: Optional[str]
 
 
+def _collect_chunks(
+    search_results: Iterable[Any], threshold: Optional[float]
+) -> List[RetrievedChunk]:
+    """Convert raw search results into :class:`RetrievedChunk` instances.
+
+    The steady-state hot loop under query load, kept as a free function so it
+    can be profiled (or compiled) in isolation from the client plumbing.
+    """
+
+    collected: List[RetrievedChunk] = []
+    for result in search_results:
+        score = result.score
+        if threshold is not None and score < threshold:
+            continue
+        texts = [chunk.text for chunk in result.content if chunk.type == "text"]
+        text = texts[0] if len(texts) == 1 else "\n\n".join(texts)
+        collected.append(
+            RetrievedChunk(
+                file_id=result.file_id,
+                filename=result.filename,
+                score=score,
+                text=text,
+                attributes=result.attributes,
+            )
+        )
+    return collected
+
+
 class OpenAIContextStore:
     """Helper class that wraps the OpenAI SDK for vector store operations."""
 
@@ -156,6 +277,10 @@ class OpenAIContextStore:
                 "OPENAI_API_KEY (or CONTEXT_DB_OPENAI_API_KEY) must be set before starting the MCP server."
             )
 
+        # Imported lazily so that merely importing this module (e.g. for a
+        # tools/list probe) does not pay the full OpenAI SDK import cost.
+        from openai import AuthenticationError, NotFoundError, OpenAI
+
         self._settings = settings
         self._client = OpenAI(
             api_key=settings.openai_api_key,
@@ -164,6 +289,12 @@ class OpenAIContextStore:
             timeout=settings.request_timeout_seconds,
             max_retries=3,
         )
+        self._store_cache: Dict[str, VectorStore] = {}
+        self._name_index: Optional[Dict[str, VectorStore]] = None
+        self._name_index_ts = 0.0
+        # Errors that mean a cached store handle can no longer be trusted:
+        # the store was deleted (404) or the credentials changed (401).
+        self._stale_handle_errors = (AuthenticationError, NotFoundError)
 
     def ensure_vector_store(
         self,
@@ -171,17 +302,38 @@ class OpenAIContextStore:
         vector_store_name: Optional[str],
         metadata: Optional[AttributesType] = None,
     ) -> VectorStore:
-        """Resolve or lazily create a vector store."""
+        """Resolve or lazily create a vector store.
+
+        Precedence: an explicit ``vector_store_id`` always wins, then a
+        requested ``vector_store_name`` (resolved by id when it matches the
+        configured default name and a default id is set), then the configured
+        default id, then the configured default name.
+        """
+
+        # Hoist the attribute chain once; each lookup below is a dict probe.
+        vector_stores = self._client.vector_stores
 
         if vector_store_id:
             logger.debug("Using provided vector store id %s", vector_store_id)
-            return self._client.vector_stores.retrieve(vector_store_id)
+            return self._retrieve_store(vector_store_id)
+
+        if (
+            vector_store_name
+            and vector_store_name == self._settings.default_vector_store_name
+            and self._settings.default_vector_store_id
+        ):
+            # The requested name is the configured default store; resolve it
+            # by id instead of paging through the listing for a name match.
+            logger.debug(
+                "Resolving default store name %s via configured id", vector_store_name
+            )
+            return self._retrieve_store(self._settings.default_vector_store_id)
 
         if not vector_store_name:
             fallback_id = self._settings.default_vector_store_id
             if fallback_id:
                 logger.debug("Falling back to configured vector store id %s", fallback_id)
-                return self._client.vector_stores.retrieve(fallback_id)
+                return self._retrieve_store(fallback_id)
 
             fallback_name = self._settings.default_vector_store_name
             if fallback_name:
@@ -190,7 +342,9 @@ class OpenAIContextStore:
                 if existing:
                     return existing
                 logger.info("Creating default vector store named %s", fallback_name)
-                return self._client.vector_stores.create(name=fallback_name, metadata=metadata)
+                store = vector_stores.create(name=fallback_name, metadata=metadata)
+                self._remember_store_name(store)
+                return store
 
             raise ValueError(
                 "No vector store identifier was provided and no defaults are configured."
@@ -202,7 +356,48 @@ class OpenAIContextStore:
             return existing_store
 
         logger.info("Creating vector store named %s", vector_store_name)
-        return self._client.vector_stores.create(name=vector_store_name, metadata=metadata)
+        store = vector_stores.create(name=vector_store_name, metadata=metadata)
+        self._remember_store_name(store)
+        return store
+
+    def _retrieve_store(self, vector_store_id: str) -> VectorStore:
+        """Retrieve a vector store by id, memoizing the resolved handle.
+
+        Each tool call funnels through :meth:`ensure_vector_store`; caching the
+        handle saves one HTTP round-trip per call on the common default-store
+        workflow. Cached handles are evicted by :meth:`_invalidate_store` when
+        a downstream call fails with 404/401, so stale handles (deleted
+        stores, revoked keys) are re-resolved on the next call.
+        """
+
+        cached = self._store_cache.get(vector_store_id)
+        if cached is not None:
+            return cached
+
+        store = self._client.vector_stores.retrieve(vector_store_id)
+        self._store_cache[vector_store_id] = store
+        return store
+
+    def _invalidate_store(self, vector_store_id: str) -> None:
+        """Drop cached handles for a store the API no longer recognizes."""
+
+        self._store_cache.pop(vector_store_id, None)
+        if self._name_index:
+            self._name_index = {
+                name: store
+                for name, store in self._name_index.items()
+                if store.id != vector_store_id
+            }
+
+    @contextmanager
+    def _invalidate_on_stale(self, vector_store_id: str) -> Iterator[None]:
+        """Evict the cached handle if the wrapped call hits a 404/401."""
+
+        try:
+            yield
+        except self._stale_handle_errors:
+            self._invalidate_store(vector_store_id)
+            raise
 
     def _prepare_upload(
         self,
@@ -210,8 +405,19 @@ class OpenAIContextStore:
         content: str,
         mime_type: str,
     ) -> FileTypes:
-        buffer = io.BytesIO(content.encode("utf-8"))
-        buffer.seek(0)
+        if len(content) < _STREAMING_ENCODE_THRESHOLD:
+            # BytesIO initializes positioned at offset 0; a seek(0) here
+            # would be a redundant no-op.
+            buffer = io.BytesIO(content.encode("utf-8"))
+        else:
+            # Encode in slices so peak memory stays near one copy of the
+            # document instead of str + bytes simultaneously.
+            encoder = codecs.getincrementalencoder("utf-8")()
+            buffer = io.BytesIO()
+            for start in range(0, len(content), _ENCODE_CHUNK_CHARS):
+                buffer.write(encoder.encode(content[start : start + _ENCODE_CHUNK_CHARS]))
+            buffer.write(encoder.encode("", final=True))
+            buffer.seek(0)
         return (filename, buffer, mime_type)
 
     def ingest(self, request: IngestDocumentRequest) -> IngestDocumentResponse:
@@ -227,13 +433,7 @@ class OpenAIContextStore:
             metadata=metadata,
         )
 
-        filename = request.filename or self._derive_filename(request)
-        attributes = dict(request.attributes or {})
-        if request.document_id:
-            attributes.setdefault("document_id", request.document_id)
-        if request.summary:
-            attributes.setdefault("summary", request.summary)
-        attributes.setdefault("ingested_at", datetime.now(timezone.utc).isoformat())
+        filename, attributes = self._filename_and_attributes(request)
 
         upload = self._prepare_upload(filename, request.content, request.mime_type)
 
@@ -245,27 +445,191 @@ class OpenAIContextStore:
             "Uploading document %s to vector store %s", filename, vector_store.id
         )
 
-        vector_store_file = self._client.vector_stores.files.upload_and_poll(
-            vector_store_id=vector_store.id,
-            file=upload,
-            attributes=attributes or None,
-            **upload_kwargs,
-        )
+        files_api = self._client.vector_stores.files
+        with self._invalidate_on_stale(vector_store.id):
+            vector_store_file = files_api.upload_and_poll(
+                vector_store_id=vector_store.id,
+                file=upload,
+                attributes=attributes or None,
+                **upload_kwargs,
+            )
 
         if vector_store_file.status != "completed":
             logger.warning(
                 "Vector store file %s completed with status %s", vector_store_file.id, vector_store_file.status
             )
 
-        return IngestDocumentResponse(
+        # Outbound models carry server-trusted values straight from the SDK;
+        # model_construct skips re-validating them.
+        return IngestDocumentResponse.model_construct(
             vector_store_id=vector_store.id,
-            vector_store_name=getattr(vector_store, "name", None),
+            vector_store_name=vector_store.name,
             file_id=vector_store_file.id,
             filename=filename,  # Use the filename we prepared, not from vector_store_file
             status=vector_store_file.status,
             attributes=vector_store_file.attributes,
         )
 
+    def ingest_many(self, requests: List[IngestDocumentRequest]) -> List[IngestDocumentResponse]:
+        """Ingest several documents, overlapping uploads and batching polls.
+
+        Uploads run concurrently on a small thread pool, then completion is
+        detected with one ``files.list`` call per poll interval and store
+        rather than one blocking ``upload_and_poll`` loop per document.
+        Responses are returned in request order.
+        """
+
+        if not requests:
+            return []
+        if len(requests) == 1:
+            return [self.ingest(requests[0])]
+
+        prepared = []
+        for request in requests:
+            metadata: AttributesType | None = {} if request.vector_store_name else None
+            vector_store = self.ensure_vector_store(
+                vector_store_id=request.vector_store_id,
+                vector_store_name=request.vector_store_name,
+                metadata=metadata,
+            )
+            filename, attributes = self._filename_and_attributes(request)
+            prepared.append((request, vector_store, filename, attributes))
+
+        def upload_one(item):
+            request, vector_store, filename, attributes = item
+            with self._invalidate_on_stale(vector_store.id):
+                return self._upload(vector_store.id, request, filename, attributes)
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(prepared), _MAX_UPLOAD_WORKERS)
+        ) as pool:
+            file_ids = list(pool.map(upload_one, prepared))
+
+        by_store: Dict[str, List[str]] = {}
+        for (_, vector_store, _, _), file_id in zip(prepared, file_ids):
+            by_store.setdefault(vector_store.id, []).append(file_id)
+
+        statuses: Dict[str, str] = {}
+        for store_id, ids in by_store.items():
+            with self._invalidate_on_stale(store_id):
+                statuses.update(self._poll_many(store_id, ids))
+
+        responses: List[IngestDocumentResponse] = []
+        for (_, vector_store, filename, attributes), file_id in zip(prepared, file_ids):
+            status = statuses.get(file_id, "in_progress")
+            if status != "completed":
+                logger.warning(
+                    "Vector store file %s completed with status %s", file_id, status
+                )
+            responses.append(
+                IngestDocumentResponse.model_construct(
+                    vector_store_id=vector_store.id,
+                    vector_store_name=vector_store.name,
+                    file_id=file_id,
+                    filename=filename,
+                    status=status,
+                    attributes=attributes or None,
+                )
+            )
+        return responses
+
+    def _filename_and_attributes(
+        self, request: IngestDocumentRequest
+    ) -> tuple[str, AttributesType]:
+        """Derive the upload filename and merged attribute dict for a request."""
+
+        now = datetime.now(timezone.utc)
+        filename = request.filename or self._derive_filename(request, now)
+        added: AttributesType = {}
+        if request.document_id:
+            added["document_id"] = request.document_id
+        if request.summary:
+            added["summary"] = request.summary
+        added["ingested_at"] = now.isoformat()
+        if request.attributes:
+            # Caller-supplied attributes win over the derived ones, matching
+            # the setdefault semantics this replaces.
+            attributes = {**added, **request.attributes}
+        else:
+            attributes = added
+        return filename, attributes
+
+    def _upload(
+        self,
+        vector_store_id: str,
+        request: IngestDocumentRequest,
+        filename: str,
+        attributes: AttributesType,
+    ) -> str:
+        """Upload and attach a document without waiting for processing."""
+
+        upload = self._prepare_upload(filename, request.content, request.mime_type)
+        upload_kwargs: Dict[str, Any] = {}
+        if request.chunking_strategy is not None:
+            upload_kwargs["chunking_strategy"] = request.chunking_strategy
+
+        logger.info("Uploading document %s to vector store %s", filename, vector_store_id)
+        file_object = self._client.files.create(file=upload, purpose="assistants")
+        vector_store_file = self._client.vector_stores.files.create(
+            vector_store_id=vector_store_id,
+            file_id=file_object.id,
+            attributes=attributes or None,
+            **upload_kwargs,
+        )
+        return vector_store_file.id
+
+    def _poll_many(
+        self,
+        vector_store_id: str,
+        file_ids: List[str],
+        poll_interval: float = 0.5,
+    ) -> Dict[str, str]:
+        """Poll processing status for many files with batched list calls.
+
+        Each round lists the store newest-first and stops as soon as every
+        batch file has been accounted for, so a round costs at most
+        ``ceil(N / page size)`` list requests (plus one page of slack for
+        concurrent writers) no matter how many unrelated files the store
+        already holds. Files still pending when the configured request
+        timeout elapses are reported as ``in_progress``.
+        """
+
+        pending = set(file_ids)
+        statuses: Dict[str, str] = {}
+        deadline = time.monotonic() + self._settings.request_timeout_seconds
+        interval = poll_interval
+        files_api = self._client.vector_stores.files
+        # The batch's files were just created, so a newest-first scan finds
+        # them in the first ceil(N / page size) entries; the extra page of
+        # slack absorbs files interleaved by concurrent writers. The cap
+        # keeps a missing file from dragging the scan through every
+        # pre-existing file in the store.
+        scan_limit = len(file_ids) + 100
+        while pending:
+            scanned = 0
+            for vector_store_file in files_api.list(
+                vector_store_id=vector_store_id, limit=100, order="desc"
+            ):
+                if (
+                    vector_store_file.id in pending
+                    and vector_store_file.status != "in_progress"
+                ):
+                    statuses[vector_store_file.id] = vector_store_file.status
+                    pending.discard(vector_store_file.id)
+                    if not pending:
+                        break
+                scanned += 1
+                if scanned >= scan_limit:
+                    break
+            if not pending or time.monotonic() >= deadline:
+                break
+            time.sleep(interval)
+            interval = min(interval * 2, 5.0)
+
+        for file_id in pending:
+            statuses[file_id] = "in_progress"
+        return statuses
+
     def retrieve(self, request: RetrieveRelevantChunksRequest) -> RetrieveRelevantChunksResponse:
         """Retrieve relevant chunks from the vector store."""
 
@@ -283,31 +647,26 @@ class OpenAIContextStore:
             search_kwargs["filters"] = {"attributes": request.attributes_filter}
         if request.rewrite_query is not None:
             search_kwargs["rewrite_query"] = request.rewrite_query
+        if request.score_threshold is not None:
+            # Filter server-side so below-threshold chunks are never decoded
+            # or validated client-side; the local check in _collect_chunks
+            # stays as a cheap belt-and-braces guard.
+            search_kwargs["ranking_options"] = {
+                "score_threshold": request.score_threshold
+            }
 
         logger.debug(
             "Searching vector store %s for query %s", vector_store.id, request.query
         )
 
-        search_results = self._client.vector_stores.search(
-            vector_store.id, **search_kwargs
-        )
-
-        collected: List[RetrievedChunk] = []
-        for result in search_results:
-            if request.score_threshold is not None and result.score < request.score_threshold:
-                continue
-            text = "\n\n".join(chunk.text for chunk in result.content if chunk.type == "text")
-            collected.append(
-                RetrievedChunk(
-                    file_id=result.file_id,
-                    filename=result.filename,
-                    score=result.score,
-                    text=text,
-                    attributes=result.attributes,
-                )
+        with self._invalidate_on_stale(vector_store.id):
+            search_results = self._client.vector_stores.search(
+                vector_store.id, **search_kwargs
             )
 
-        return RetrieveRelevantChunksResponse(
+        collected = _collect_chunks(search_results, request.score_threshold)
+
+        return RetrieveRelevantChunksResponse.model_construct(
             vector_store_id=vector_store.id,
             query=request.query,
             results=collected,
@@ -323,40 +682,79 @@ class OpenAIContextStore:
             vector_store_name=None,
         )
 
-        return GetVectorStoreInfoResponse(
+        return GetVectorStoreInfoResponse.model_construct(
             vector_store_id=vector_store.id,
-            vector_store_name=getattr(vector_store, "name", None),
+            vector_store_name=vector_store.name,
         )
 
     def _find_vector_store_by_name(self, name: str) -> Optional[VectorStore]:
-        """Return an existing vector store that matches the provided name."""
+        """Return an existing vector store that matches the provided name.
+
+        The listing is paged through once and cached as a name -> store index
+        for :data:`_NAME_INDEX_TTL_SECONDS`, so repeated name lookups are O(1)
+        dict probes instead of a fresh scan over up to 100 stores. A hit is
+        served from the cached index, but a miss always re-lists before
+        reporting the store absent: callers create a store on a miss, and a
+        stale negative answer would duplicate one created by another process
+        within the TTL window.
+        """
+
+        now = time.monotonic()
+        if (
+            self._name_index is not None
+            and now - self._name_index_ts < _NAME_INDEX_TTL_SECONDS
+        ):
+            store = self._name_index.get(name)
+            if store is not None:
+                return store
+
+        index = self._build_name_index()
+        if index is None:
+            return None
+
+        self._name_index = index
+        self._name_index_ts = now
+        return index.get(name)
+
+    def _build_name_index(self) -> Optional[Dict[str, VectorStore]]:
+        """Page through the store listing once, building a name index."""
 
         try:
             pages = self._client.vector_stores.list(limit=100, order="desc")
+            index: Dict[str, VectorStore] = {}
+            for store in pages:
+                # The listing is newest-first; keep the first store seen per
+                # name to match the previous first-match behaviour.
+                if store.name and store.name not in index:
+                    index[store.name] = store
         except Exception as exc:  # pragma: no cover - defensive guard for API errors
             logger.warning("Failed to list vector stores: %s", exc)
             return None
 
-        for store in pages:
-            if getattr(store, "name", None) == name:
-                return store
+        return index
+
+    def _remember_store_name(self, store: VectorStore) -> None:
+        """Insert a freshly created store into the name index, if one exists."""
 
-        return None
+        store_name = store.name
+        if self._name_index is not None and store_name:
+            self._name_index[store_name] = store
 
     @staticmethod
-    def _derive_filename(request: IngestDocumentRequest) -> str:
+    def _derive_filename(request: IngestDocumentRequest, now: datetime) -> str:
         if request.document_id:
             return f"{request.document_id}.txt"
         if request.summary:
-            slug = request.summary.lower().replace(" ", "-")[:40]
-            return f"{slug or 'context'}-{int(datetime.now(timezone.utc).timestamp())}.txt"
-        return f"context-{int(datetime.now(timezone.utc).timestamp())}.txt"
+            slug = request.summary[:40].lower().translate(_SLUG_TABLE)
+            return f"{slug or 'context'}-{int(now.timestamp())}.txt"
+        return f"context-{int(now.timestamp())}.txt"
 
 
 __all__ = [
     "AttributesType",
     "IngestDocumentRequest",
     "IngestDocumentResponse",
+    "IngestDocumentsResponse",
     "RetrieveRelevantChunksRequest",
     "RetrieveRelevantChunksResponse",
     "RetrievedChunk",
@@ -3,8 +3,11 @@
 import os
 from unittest.mock import MagicMock, Mock, patch
 
+import httpx
 import pytest
+from openai import NotFoundError
 
+from context_db_mcp import server as server_module
 from context_db_mcp.config import Settings
 from context_db_mcp.server import build_server
 from context_db_mcp.vector_store import (
@@ -16,9 +19,13 @@ from context_db_mcp.vector_store import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_settings():
-    """Create mock settings for testing."""
+    """Create mock settings for testing.
+
+    Module-scoped: the settings are read-only, so building them once per
+    module avoids re-parsing the environment for every test.
+    """
     # Create settings without loading .env file
     with patch.dict(os.environ, {
         "OPENAI_API_KEY": "sk-test-key",
@@ -30,9 +37,14 @@ def mock_settings():
         return settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_openai_client():
-    """Create a mock OpenAI client."""
+    """Create a mock OpenAI client.
+
+    Module-scoped because assembling the ~10-attribute Mock tree per test is
+    comparatively expensive; tests that swap return values must restore them
+    (see test_retrieve_with_score_threshold).
+    """
     client = MagicMock()
     
     # Mock vector store
@@ -66,10 +78,22 @@ def mock_openai_client():
     mock_search_result.content = [mock_content]
     
     client.vector_stores.search.return_value = [mock_search_result]
-    
+
     return client
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_client_calls(mock_openai_client):
+    """Clear recorded calls on the shared client before each test.
+
+    reset_mock() drops call records but keeps the configured return values,
+    so call-count assertions stay hermetic without rebuilding the
+    module-scoped mock tree per test.
+    """
+    mock_openai_client.reset_mock()
+    yield
+
+
 class TestSettings:
     """Test configuration management."""
     
@@ -94,60 +118,63 @@ class TestSettings:
 
 class TestIngestDocumentRequest:
     """Test document ingestion request validation."""
-    
-    def test_valid_request(self):
-        """Test valid ingestion request."""
-        request = IngestDocumentRequest(
-            content="This is test content",
-            document_id="doc1",
-            summary="Test document",
-        )
-        assert request.content == "This is test content"
-        assert request.document_id == "doc1"
-        assert request.summary == "Test document"
-    
-    def test_empty_content_raises_error(self):
-        """Test that empty content raises validation error."""
-        with pytest.raises(ValueError, match="empty after stripping whitespace"):
-            IngestDocumentRequest(content="   ")
-    
-    def test_whitespace_trimmed(self):
-        """Test content with whitespace is valid."""
-        request = IngestDocumentRequest(content="  test content  ")
-        assert request.content == "  test content  "
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expect_error"),
+        [
+            (
+                {
+                    "content": "This is test content",
+                    "document_id": "doc1",
+                    "summary": "Test document",
+                },
+                None,
+            ),
+            ({"content": "  test content  "}, None),
+            ({"content": "   "}, "empty after stripping whitespace"),
+        ],
+    )
+    def test_request_validation(self, kwargs, expect_error):
+        """Test that real content is accepted verbatim and blank content rejected."""
+        if expect_error:
+            with pytest.raises(ValueError, match=expect_error):
+                IngestDocumentRequest(**kwargs)
+        else:
+            request = IngestDocumentRequest(**kwargs)
+            for field, value in kwargs.items():
+                assert getattr(request, field) == value
 
 
 class TestRetrieveRelevantChunksRequest:
     """Test chunk retrieval request validation."""
-    
-    def test_valid_request(self):
-        """Test valid retrieval request."""
-        request = RetrieveRelevantChunksRequest(
-            query="Find information about authentication",
-            max_results=10,
-            score_threshold=0.7,
-        )
-        assert request.query == "Find information about authentication"
-        assert request.max_results == 10
-        assert request.score_threshold == 0.7
-    
-    def test_empty_query_raises_error(self):
-        """Test that empty query raises validation error."""
-        with pytest.raises(ValueError, match="empty after stripping whitespace"):
-            RetrieveRelevantChunksRequest(query="   ")
-    
-    def test_max_results_bounds(self):
-        """Test max_results validation bounds."""
-        # Valid ranges
-        RetrieveRelevantChunksRequest(query="test", max_results=1)
-        RetrieveRelevantChunksRequest(query="test", max_results=50)
-        
-        # Invalid ranges
-        with pytest.raises(ValueError):
-            RetrieveRelevantChunksRequest(query="test", max_results=0)
-        
-        with pytest.raises(ValueError):
-            RetrieveRelevantChunksRequest(query="test", max_results=51)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expect_error"),
+        [
+            (
+                {
+                    "query": "Find information about authentication",
+                    "max_results": 10,
+                    "score_threshold": 0.7,
+                },
+                None,
+            ),
+            ({"query": "test", "max_results": 1}, None),
+            ({"query": "test", "max_results": 50}, None),
+            ({"query": "   "}, "empty after stripping whitespace"),
+            ({"query": "test", "max_results": 0}, "max_results"),
+            ({"query": "test", "max_results": 51}, "max_results"),
+        ],
+    )
+    def test_request_validation(self, kwargs, expect_error):
+        """Test query emptiness and max_results bounds validation."""
+        if expect_error:
+            with pytest.raises(ValueError, match=expect_error):
+                RetrieveRelevantChunksRequest(**kwargs)
+        else:
+            request = RetrieveRelevantChunksRequest(**kwargs)
+            for field, value in kwargs.items():
+                assert getattr(request, field) == value
 
 
 class TestOpenAIContextStore:
@@ -160,14 +187,14 @@ class TestOpenAIContextStore:
             with pytest.raises(RuntimeError, match="OPENAI_API_KEY"):
                 OpenAIContextStore(settings)
     
-    @patch("context_db_mcp.vector_store.OpenAI")
+    @patch("openai.OpenAI")
     def test_init_with_api_key(self, mock_openai_class, mock_settings):
         """Test successful initialization with API key."""
         store = OpenAIContextStore(mock_settings)
         mock_openai_class.assert_called_once()
         assert store is not None
     
-    @patch("context_db_mcp.vector_store.OpenAI")
+    @patch("openai.OpenAI")
     def test_ingest_document(self, mock_openai_class, mock_settings, mock_openai_client):
         """Test document ingestion."""
         mock_openai_class.return_value = mock_openai_client
@@ -190,7 +217,44 @@ class TestOpenAIContextStore:
         # Verify upload was called
         mock_openai_client.vector_stores.files.upload_and_poll.assert_called_once()
     
-    @patch("context_db_mcp.vector_store.OpenAI")
+    @patch("openai.OpenAI")
+    def test_ingest_many_documents(self, mock_openai_class, mock_settings, mock_openai_client):
+        """Test batched document ingestion."""
+        mock_openai_class.return_value = mock_openai_client
+
+        uploaded = Mock()
+        uploaded.id = "file_raw123"
+        mock_openai_client.files.create.return_value = uploaded
+
+        attached = Mock()
+        attached.id = "file_test123"
+        attached.status = "in_progress"
+        mock_openai_client.vector_stores.files.create.return_value = attached
+
+        completed = Mock()
+        completed.id = "file_test123"
+        completed.status = "completed"
+        mock_openai_client.vector_stores.files.list.return_value = [completed]
+
+        store = OpenAIContextStore(mock_settings)
+
+        requests = [
+            IngestDocumentRequest(content="First document", document_id="doc1"),
+            IngestDocumentRequest(content="Second document", document_id="doc2"),
+        ]
+
+        responses = store.ingest_many(requests)
+
+        assert len(responses) == 2
+        assert all(r.status == "completed" for r in responses)
+        assert responses[0].filename == "doc1.txt"
+        assert responses[1].filename == "doc2.txt"
+
+        # Both uploads went through the non-blocking create path
+        assert mock_openai_client.files.create.call_count == 2
+        assert mock_openai_client.vector_stores.files.create.call_count == 2
+
+    @patch("openai.OpenAI")
     def test_retrieve_chunks(self, mock_openai_class, mock_settings, mock_openai_client):
         """Test chunk retrieval."""
         mock_openai_class.return_value = mock_openai_client
@@ -213,7 +277,7 @@ class TestOpenAIContextStore:
         # Verify search was called
         mock_openai_client.vector_stores.search.assert_called_once()
     
-    @patch("context_db_mcp.vector_store.OpenAI")
+    @patch("openai.OpenAI")
     def test_retrieve_with_score_threshold(self, mock_openai_class, mock_settings, mock_openai_client):
         """Test retrieval with score threshold filtering."""
         mock_openai_class.return_value = mock_openai_client
@@ -239,25 +303,76 @@ class TestOpenAIContextStore:
         content2.text = "Low score content"
         result2.content = [content2]
         
+        # The client mock is shared across the module; restore the original
+        # search results after mutating them.
+        original_results = mock_openai_client.vector_stores.search.return_value
         mock_openai_client.vector_stores.search.return_value = [result1, result2]
-        
+        try:
+            store = OpenAIContextStore(mock_settings)
+
+            request = RetrieveRelevantChunksRequest(
+                query="test query",
+                score_threshold=0.8,
+            )
+
+            response = store.retrieve(request)
+
+            # The threshold is pushed down to the search call itself
+            _, search_kwargs = mock_openai_client.vector_stores.search.call_args
+            assert search_kwargs["ranking_options"] == {"score_threshold": 0.8}
+
+            # Results below the threshold are dropped even if returned
+            assert len(response.results) == 1
+            assert response.results[0].score == 0.95
+        finally:
+            mock_openai_client.vector_stores.search.return_value = original_results
+
+    @patch("openai.OpenAI")
+    def test_stale_store_handle_invalidated(self, mock_openai_class, mock_settings, mock_openai_client):
+        """Test that a 404 from the API evicts the cached store handle."""
+        mock_openai_class.return_value = mock_openai_client
         store = OpenAIContextStore(mock_settings)
-        
-        request = RetrieveRelevantChunksRequest(
-            query="test query",
-            score_threshold=0.8,
+
+        request = RetrieveRelevantChunksRequest(query="test", vector_store_id="vs_test123")
+        store.retrieve(request)
+        retrieve_calls = mock_openai_client.vector_stores.retrieve.call_count
+
+        # The second call reuses the cached handle without a new round-trip.
+        store.retrieve(request)
+        assert mock_openai_client.vector_stores.retrieve.call_count == retrieve_calls
+
+        not_found = NotFoundError(
+            "store deleted",
+            response=httpx.Response(404, request=httpx.Request("POST", "https://test")),
+            body=None,
         )
-        
-        response = store.retrieve(request)
-        
-        # Only high-score result should be returned
-        assert len(response.results) == 1
-        assert response.results[0].score == 0.95
+        mock_openai_client.vector_stores.search.side_effect = not_found
+        try:
+            with pytest.raises(NotFoundError):
+                store.retrieve(request)
+        finally:
+            mock_openai_client.vector_stores.search.side_effect = None
+
+        # The stale handle was dropped, so the next call re-resolves the store.
+        store.retrieve(request)
+        assert mock_openai_client.vector_stores.retrieve.call_count == retrieve_calls + 1
 
 
 class TestMCPServer:
     """Test MCP server setup and tools."""
-    
+
+    @pytest.fixture(autouse=True)
+    def _fresh_store_cache(self):
+        """Isolate the per-settings store cache around each test.
+
+        build_server runs here with OpenAIContextStore patched; without
+        clearing, the mock store would stay cached under the module-scoped
+        settings and leak into any later build_server call.
+        """
+        server_module._STORE_CACHE.clear()
+        yield
+        server_module._STORE_CACHE.clear()
+
     def test_build_server_with_settings(self, mock_settings):
         """Test server builds successfully with settings."""
         with patch("context_db_mcp.server.OpenAIContextStore"):